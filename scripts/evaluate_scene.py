@@ -102,7 +102,12 @@ def run_evaluation() -> list[dict]:
 
     from src.perception.scene import SmolVLM2Scene
 
-    vlm = SmolVLM2Scene(model_id=cfg["scene"]["model"])
+    # Benchmark must infer every image — disable the static-scene cache
+    vlm = SmolVLM2Scene(
+        model_id=cfg["scene"]["model"],
+        max_stale_seconds=0,
+        quantization=cfg["scene"].get("quantization"),
+    )
     print("  Loading SmolVLM2...")
     t_load = time.monotonic()
     vlm.load()
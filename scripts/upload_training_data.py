@@ -18,7 +18,9 @@ Usage:
 
 import argparse
 import json
+import os
 import random
+import re
 import shutil
 import subprocess
 import sys
@@ -30,6 +32,10 @@ import yaml
 CONFIG_PATH = Path("config/default.yaml")
 COLLECTION_DIR = Path("data/collection/audio")
 
+# Sidecars are small JSON written by PerceptionService._save_audio; only the
+# top-level "confidence" field matters here, so pull it out without a full parse.
+_CONFIDENCE_RE = re.compile(rb'"confidence"\s*:\s*(-?[0-9.eE+-]+)')
+
 
 def load_config() -> dict:
     with open(CONFIG_PATH) as f:
@@ -62,7 +68,9 @@ def collect_upload_candidates(
     Return (list of WAV paths to upload, stats dict).
     Each WAV must have a matching .json sidecar.
     """
-    all_wavs = sorted(collection_dir.glob("*.wav"))
+    # One directory read: names come back with the listing, no per-file stat/glob
+    names = {entry.name for entry in os.scandir(collection_dir) if entry.is_file()}
+    all_wavs = [collection_dir / n for n in sorted(names) if n.endswith(".wav")]
     if not all_wavs:
         return [], {"total": 0, "low_conf": 0, "high_conf_sampled": 0}
 
@@ -71,14 +79,12 @@ def collect_upload_candidates(
 
     for wav in all_wavs:
         meta_path = wav.with_suffix(".json")
-        if not meta_path.exists():
+        if meta_path.name not in names:
             continue
-        with open(meta_path) as f:
-            meta = json.load(f)
 
         if upload_all:
             low_conf_wavs.append(wav)
-        elif meta.get("confidence", 1.0) < confidence_threshold:
+        elif _read_confidence(meta_path) < confidence_threshold:
             low_conf_wavs.append(wav)
         else:
             high_conf_wavs.append(wav)
@@ -102,23 +108,42 @@ def collect_upload_candidates(
     return selected, stats
 
 
-def stage_for_upload(wavs: list[Path]) -> Path:
+def _read_confidence(meta_path: Path) -> float:
+    """Top-level sidecar confidence (default 1.0 if absent); full JSON parse only as fallback."""
+    data = meta_path.read_bytes()
+    match = _CONFIDENCE_RE.search(data)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            pass
+    return json.loads(data).get("confidence", 1.0)
+
+
+def write_files_from(wavs: list[Path], list_path: Path) -> None:
     """
-    Copy selected WAVs + JSON sidecars to a temp staging directory.
-    rclone will copy this directory to Drive.
+    Write an rclone --files-from list: selected WAVs + JSON sidecars, as names
+    relative to the collection dir. rclone reads straight from the collection
+    dir — no staging copy.
     """
-    staging = Path(tempfile.mkdtemp(prefix="winston-upload-"))
+    names = []
     for wav in wavs:
-        shutil.copy2(wav, staging / wav.name)
-        json_path = wav.with_suffix(".json")
-        if json_path.exists():
-            shutil.copy2(json_path, staging / json_path.name)
-    return staging
-
-
-def rclone_copy(staging: Path, remote: str, drive_folder: str, dry_run: bool) -> bool:
+        names.append(wav.name)
+        names.append(wav.with_suffix(".json").name)
+    list_path.write_text("\n".join(names) + "\n")
+
+
+def rclone_copy(
+    source: Path,
+    remote: str,
+    drive_folder: str,
+    dry_run: bool,
+    files_from: Path | None = None,
+) -> bool:
     dest = f"{remote}:{drive_folder}/audio"
-    cmd = ["rclone", "copy", str(staging), dest, "--progress"]
+    cmd = ["rclone", "copy", str(source), dest, "--progress"]
+    if files_from is not None:
+        cmd += ["--files-from", str(files_from)]
     if dry_run:
         cmd.append("--dry-run")
 
@@ -169,11 +194,13 @@ def main() -> None:
         print("Nothing to upload. Run the perception service to collect some data first.")
         sys.exit(0)
 
-    staging = stage_for_upload(wavs)
-    try:
-        success = rclone_copy(staging, remote, drive_data_folder, dry_run=args.dry_run)
-    finally:
-        shutil.rmtree(staging)
+    with tempfile.TemporaryDirectory(prefix="winston-upload-") as tmp:
+        list_path = Path(tmp) / "files.txt"
+        write_files_from(wavs, list_path)
+        success = rclone_copy(
+            COLLECTION_DIR, remote, drive_data_folder,
+            dry_run=args.dry_run, files_from=list_path,
+        )
 
     if success:
         if args.dry_run:
@@ -1,15 +1,24 @@
 """
 Memory monitor — publishes system RAM stats every N seconds to:
   system/debug/memory_monitor  — per-process and system-wide view
-  system/health                — simple subsystem heartbeat
+  system/health                — simple subsystem heartbeat (every health_interval)
+
+Memory stats are delta-encoded: a tick only publishes if free memory moved by
+≥50 MB since the last publish, or on a health tick (so consumers still see a
+periodic full sample).
 
 Alerts to stderr when free memory drops below the configured threshold.
 Start this early; it's how you catch leaks under sustained load.
+
+On Linux, stats are read with pread() on persistent /proc/meminfo and
+/proc/self/status fds (2 syscalls/tick); elsewhere (macOS) via psutil.
 """
 
 import logging
+import os
+import re
+import sys
 import threading
-import time
 
 import psutil
 
@@ -19,6 +28,11 @@ from src.transport.topics import System
 logger = logging.getLogger(__name__)
 
 BYTES_PER_MB = 1024 * 1024
+_MEMORY_DELTA_MB = 50   # republish memory stats only when free_mb moves at least this much
+
+_MEMAVAIL_RE = re.compile(rb"^MemAvailable:\s+(\d+) kB", re.M)
+_VMRSS_RE   = re.compile(rb"^VmRSS:\s+(\d+) kB", re.M)
+_PROC_READ_BYTES = 4096
 
 
 class MemoryMonitor:
@@ -27,11 +41,39 @@ class MemoryMonitor:
         mqtt: MQTTClient,
         interval_seconds: int = 30,
         alert_headroom_mb: int = 2048,
+        health_interval_seconds: int | None = None,
     ) -> None:
         self._mqtt = mqtt
         self._interval = interval_seconds
+        # Heartbeat consumers sample at minute granularity — don't broadcast health
+        # at the memory sampling rate. Default: every 5th memory tick.
+        self._health_interval = health_interval_seconds or 5 * interval_seconds
         self._alert_threshold_mb = alert_headroom_mb
-        self._running = False
+        self._last_published_free_mb: int | None = None
+        # Event instead of a flag + sleep: stop() wakes the loop immediately
+        # rather than waiting out the rest of the interval.
+        self._stop_event = threading.Event()
+
+        # Long-running loop: reuse one payload dict and one Process handle
+        # instead of rebuilding them every tick.
+        self._proc = psutil.Process()
+        self._total_mb = 0   # constant for the process lifetime — read once in start()
+        self._meminfo_fd: int | None = None
+        self._status_fd: int | None = None
+        if sys.platform.startswith("linux"):
+            try:
+                self._meminfo_fd = os.open("/proc/meminfo", os.O_RDONLY)
+                self._status_fd  = os.open("/proc/self/status", os.O_RDONLY)
+            except OSError:
+                logger.debug("Memory monitor: /proc unavailable — using psutil", exc_info=True)
+                self._close_proc_fds()
+        self._mem_payload: dict[str, int] = {
+            "total_mb":    0,
+            "used_mb":     0,
+            "free_mb":     0,
+            "process_mb":  0,
+            "headroom_mb": 0,
+        }
         self._thread: threading.Thread | None = None
 
         # Subsystems register themselves here so we can include them in health pings.
@@ -52,45 +94,73 @@ class MemoryMonitor:
     # ------------------------------------------------------------------
 
     def start(self) -> None:
-        self._running = True
+        self._total_mb = psutil.virtual_memory().total // BYTES_PER_MB
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True, name="memory-monitor")
         self._thread.start()
-        logger.info("Memory monitor started (interval=%ds, alert_threshold=%dMB)",
-                    self._interval, self._alert_threshold_mb)
+        logger.info("Memory monitor started (interval=%ds, health_interval=%ds, alert_threshold=%dMB)",
+                    self._interval, self._health_interval, self._alert_threshold_mb)
 
     def stop(self) -> None:
-        self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=5)
+        self._close_proc_fds()
 
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
     def _loop(self) -> None:
-        while self._running:
-            self._publish_memory()
-            self._publish_health()
-            time.sleep(self._interval)
+        health_every = max(1, self._health_interval // self._interval)
+        n_ticks = 0
+        while not self._stop_event.is_set():
+            health_tick = n_ticks % health_every == 0
+            self._publish_memory(force=health_tick)
+            if health_tick:
+                self._publish_health()
+            n_ticks += 1
+            self._stop_event.wait(self._interval)
+
+    def _read_memory(self) -> tuple[int, int, int]:
+        """Return (used_mb, free_mb, process_mb)."""
+        if self._meminfo_fd is not None and self._status_fd is not None:
+            avail = _MEMAVAIL_RE.search(os.pread(self._meminfo_fd, _PROC_READ_BYTES, 0))
+            rss   = _VMRSS_RE.search(os.pread(self._status_fd, _PROC_READ_BYTES, 0))
+            if avail and rss:
+                free_mb = int(avail.group(1)) // 1024
+                # Same "used" definition psutil uses on Linux (total - available)
+                return self._total_mb - free_mb, free_mb, int(rss.group(1)) // 1024
 
-    def _publish_memory(self) -> None:
         vm = psutil.virtual_memory()
-        total_mb = vm.total // BYTES_PER_MB
-        used_mb  = vm.used  // BYTES_PER_MB
-        free_mb  = vm.available // BYTES_PER_MB
-
-        process = psutil.Process()
-        process_mb = process.memory_info().rss // BYTES_PER_MB
-
-        payload = {
-            "total_mb":   total_mb,
-            "used_mb":    used_mb,
-            "free_mb":    free_mb,
-            "process_mb": process_mb,
-            "headroom_mb": free_mb,
-        }
-
-        self._mqtt.publish(System.MEMORY_MONITOR, payload)
+        process_mb = self._proc.memory_info().rss // BYTES_PER_MB
+        return vm.used // BYTES_PER_MB, vm.available // BYTES_PER_MB, process_mb
+
+    def _close_proc_fds(self) -> None:
+        for fd in (self._meminfo_fd, self._status_fd):
+            if fd is not None:
+                os.close(fd)
+        self._meminfo_fd = self._status_fd = None
+
+    def _publish_memory(self, force: bool = False) -> None:
+        total_mb = self._total_mb
+        used_mb, free_mb, process_mb = self._read_memory()
+
+        payload = self._mem_payload
+        payload["total_mb"]    = total_mb
+        payload["used_mb"]     = used_mb
+        payload["free_mb"]     = free_mb
+        payload["process_mb"]  = process_mb
+        payload["headroom_mb"] = free_mb
+        payload.pop("timestamp", None)   # publish() only injects a timestamp when absent
+
+        if (
+            force
+            or self._last_published_free_mb is None
+            or abs(free_mb - self._last_published_free_mb) >= _MEMORY_DELTA_MB
+        ):
+            self._mqtt.publish(System.MEMORY_MONITOR, payload)
+            self._last_published_free_mb = free_mb
 
         if free_mb < self._alert_threshold_mb:
             logger.warning(
@@ -103,4 +173,4 @@ class MemoryMonitor:
     def _publish_health(self) -> None:
         for subsystem, metadata in self._registered.items():
             payload = {"subsystem": subsystem, "status": "ok", **metadata}
-            self._mqtt.publish(System.HEALTH, payload)
+            self._mqtt.publish(System.HEALTH, payload, qos=1)
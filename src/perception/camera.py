@@ -46,27 +46,35 @@ class Camera:
             self._cap = None
             logger.info("Camera closed")
 
-    def capture(self) -> Optional[Image.Image]:
+    def capture_bgr(self) -> Optional[np.ndarray]:
         """
-        Capture one frame. Returns a PIL Image (RGB) or None on failure.
+        Capture one frame as OpenCV's native uint8 BGR array (H, W, 3), or None on failure.
+        No color conversion or copy — callers convert only where a consumer needs RGB.
         """
         if self._cap is None:
             raise RuntimeError("Camera not open. Call open() first.")
 
-        import cv2
         ok, frame = self._cap.read()
         if not ok or frame is None:
             logger.warning("Camera: failed to read frame")
             return None
+        return frame
 
-        # OpenCV gives BGR — convert to RGB for PIL / HF processors
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return Image.fromarray(rgb)
+    def capture(self) -> Optional[Image.Image]:
+        """
+        Capture one frame. Returns a PIL Image (RGB) or None on failure.
+        """
+        rgb = self.capture_as_numpy()
+        return Image.fromarray(rgb) if rgb is not None else None
 
     def capture_as_numpy(self) -> Optional[np.ndarray]:
         """Capture one frame as a uint8 RGB numpy array (H, W, 3)."""
-        img = self.capture()
-        return np.array(img) if img is not None else None
+        frame = self.capture_bgr()
+        if frame is None:
+            return None
+        import cv2
+        # OpenCV gives BGR — convert to RGB for PIL / HF processors
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
     def __enter__(self) -> "Camera":
         self.open()
@@ -0,0 +1,106 @@
+"""
+Perception runtime — process-level resources shared by co-located services.
+
+Each service on its own builds an MQTTClient and a MemoryMonitor. When the
+audio and scene services run in one process, they share a PerceptionRuntime
+instead: one broker connection, one monitor thread (both subsystems registered
+for health pings), one config load.
+
+Run both services in one process with:
+  python -m src.perception.runtime
+"""
+
+import logging
+import signal
+import sys
+import threading
+
+from src.debug.memory_monitor import MemoryMonitor
+from src.transport.client import MQTTClient
+
+logger = logging.getLogger(__name__)
+
+
+class PerceptionRuntime:
+    """
+    Shared MQTT client + memory monitor. Reference-counted: the first start()
+    connects and starts the monitor, the last stop() tears them down, so each
+    service can call start()/stop() exactly as it would on its own.
+    """
+
+    def __init__(self, config: dict, client_id: str | None = None) -> None:
+        self.config = config
+        mqtt_cfg = config["mqtt"]
+        mon_cfg  = config["memory_monitor"]
+
+        self.mqtt = MQTTClient(
+            host=mqtt_cfg["host"],
+            port=mqtt_cfg["port"],
+            client_id=client_id or mqtt_cfg["client_id"],
+            keepalive=mqtt_cfg["keepalive"],
+        )
+        self.monitor = MemoryMonitor(
+            mqtt=self.mqtt,
+            interval_seconds=mon_cfg["interval_seconds"],
+            alert_headroom_mb=mon_cfg["alert_headroom_mb"],
+            health_interval_seconds=mon_cfg.get("health_interval_seconds"),
+        )
+
+        self._users = 0
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            self._users += 1
+            if self._users == 1:
+                self.mqtt.connect()
+                self.monitor.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users == 0:
+                self.monitor.stop()
+                self.mqtt.disconnect()
+
+
+# ------------------------------------------------------------------
+# Entry point
+# ------------------------------------------------------------------
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(name)s: %(message)s",
+    )
+
+    from src.perception.scene_service import SceneService
+    from src.perception.service import PerceptionService, load_config
+
+    config  = load_config()
+    runtime = PerceptionRuntime(config)
+
+    audio = PerceptionService(config, runtime=runtime)
+    scene = SceneService(config, runtime=runtime) if config["scene"]["enabled"] else None
+
+    def _shutdown(sig, frame):
+        logger.info("Shutting down perception runtime...")
+        if scene is not None:
+            scene.stop()
+        audio.stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT,  _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    # Scene loop in the background; the audio loop keeps the main thread
+    # (sounddevice callbacks + signal handling)
+    if scene is not None:
+        threading.Thread(target=scene.start, daemon=True, name="scene-service").start()
+    audio.start()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,39 +8,53 @@ ambient monitoring. See docs/phases/phase_a_perception.md for current status.
 
 Pipeline:
   Camera frame (every N seconds)
-    → VLMAdapter.detect(frame, passive_prompt)
     → pixel MAD change detection
-    → MQTT publish (perception/scene/snapshot)
-    → [if change detected] MQTT publish (perception/scene/change)
-    → data collection (save JPEG + JSON sidecar)
+    → [no change, cached result younger than scene.max_stale_seconds] republish it (stale=true)
+    → VLMAdapter.detect(frame, passive_prompt) on a worker thread
+      (next capture overlaps inference when inference outlasts the interval)
+    → data collection (JPEG + JSON sidecar, written by a background thread)
+    → MQTT publish (perception/scene/update — snapshot + context + change in one message)
+    → [if scene.publish_legacy_topics] also snapshot / change / context separately
 
 Run with:
   python -m src.perception.scene_service
 
 Adapter is selected via config scene.adapter (default: moondream2).
+With scene.vlm_server: true the adapter lives in a separate, long-running
+process (python -m src.perception.vlm_server) so restarts skip the weight load.
 """
 
 import json
 import logging
+import queue
 import signal
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeout
 from datetime import datetime, timezone
 from pathlib import Path
 
+import cv2
 import numpy as np
 import yaml
+from PIL import Image
 
-from src.debug.memory_monitor import MemoryMonitor
 from src.perception.camera import Camera
-from src.transport.client import MQTTClient
+from src.perception.runtime import PerceptionRuntime
+from src.perception.vlm.base import DetectionResult
 from src.transport.topics import Perception, System
 
 logger = logging.getLogger(__name__)
 
 # Pixel-level change detection (moved from SmolVLM2Scene to service level)
 _CHANGE_DETECTION_SIZE = (64, 64)
-_CHANGE_MAD_THRESHOLD  = 25.0 / 255   # mean absolute difference threshold (0–1 range)
+_CHANGE_MAD_THRESHOLD  = 25.0   # mean absolute difference threshold (0–255 gray levels)
+
+# Snapshot writes are staged through a small queue so JPEG encode + disk I/O
+# overlap with the next capture/inference instead of sitting in the loop.
+_SAVE_QUEUE_SIZE = 8
 
 # Default prompt for passive (non-targeted) operation.
 # Cerebrum-directed targeted detection uses detect_event.py + scenario YAMLs instead.
@@ -49,6 +63,7 @@ _PASSIVE_PROMPT = (
     "Respond with EXACTLY one label: COOKING, EATING, CLEANING, IDLE, or NONE_OF_ABOVE. "
     "Respond with the label only, followed by a dash and one sentence description."
 )
+_PASSIVE_LABELS = frozenset({"COOKING", "EATING", "CLEANING", "IDLE", "NONE_OF_ABOVE"})
 
 
 def load_config(path: str = "config/default.yaml") -> dict:
@@ -57,17 +72,28 @@ def load_config(path: str = "config/default.yaml") -> dict:
 
 
 def _load_adapter(scene_cfg: dict):
-    """Instantiate VLM adapter based on config scene.adapter."""
+    """Instantiate VLM adapter based on config scene.adapter (or a vlm_server client)."""
+    if scene_cfg.get("vlm_server", False):
+        from src.perception.vlm_server import SOCKET_PATH, VLMClient
+        return VLMClient(socket_path=scene_cfg.get("vlm_socket") or SOCKET_PATH)
+
     adapter_name = scene_cfg.get("adapter", "moondream2")
     model_id     = scene_cfg.get("model", "vikhyatk/moondream2")
     revision     = scene_cfg.get("model_revision", "2025-01-09")
 
     if adapter_name == "moondream2":
         from src.perception.vlm.moondream import MoondreamAdapter
-        return MoondreamAdapter(model_id=model_id, revision=revision)
+        return MoondreamAdapter(
+            model_id=model_id,
+            revision=revision,
+            quantization=scene_cfg.get("quantization"),
+        )
     elif adapter_name == "internvl2_1b":
         from src.perception.vlm.internvl2 import InternVL2Adapter
-        return InternVL2Adapter()
+        return InternVL2Adapter(
+            model_id=scene_cfg.get("internvl2_model"),
+            quant_mode=scene_cfg.get("quant_mode") or "4bit",
+        )
     else:
         raise ValueError(
             f"Unknown scene.adapter '{adapter_name}'. "
@@ -75,49 +101,69 @@ def _load_adapter(scene_cfg: dict):
         )
 
 
-def _to_gray_array(image) -> np.ndarray:
-    """Resize to small square + grayscale for fast change detection."""
-    small = image.resize(_CHANGE_DETECTION_SIZE).convert("L")
-    return np.array(small, dtype=np.float32) / 255.0
+def _to_gray_array(frame_bgr: np.ndarray) -> np.ndarray:
+    """Resize to small square + grayscale for fast change detection (BGR camera array in, uint8 out)."""
+    small = cv2.resize(frame_bgr, _CHANGE_DETECTION_SIZE, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
 
 
 def _detect_change(
     current_gray: np.ndarray,
     last_gray: np.ndarray | None,
 ) -> tuple[float, bool]:
+    """
+    Return (magnitude in 0–1, changed). Grays are uint8 and cv2.absdiff's |a−b|
+    always fits in uint8, so no upcast is needed.
+    """
     if last_gray is None:
         return 0.0, False
-    mad = float(np.mean(np.abs(current_gray.astype(float) - last_gray.astype(float))))
-    return mad, mad > _CHANGE_MAD_THRESHOLD
+    mad = float(cv2.absdiff(current_gray, last_gray).mean())
+    return mad / 255, mad > _CHANGE_MAD_THRESHOLD
 
 
 class SceneService:
-    def __init__(self, config: dict) -> None:
+    def __init__(self, config: dict, runtime: PerceptionRuntime | None = None) -> None:
         self._cfg       = config
         self._scene_cfg = config["scene"]
-        self._mqtt_cfg  = config["mqtt"]
         self._dc_cfg    = config["data_collection"]
 
+        # Per-snapshot settings, resolved once instead of dict lookups every tick
+        self._snapshot_interval    = self._scene_cfg["snapshot_interval_seconds"]
+        self._confidence_threshold = float(self._scene_cfg["confidence_threshold"])
+        self._publish_legacy       = bool(self._scene_cfg.get("publish_legacy_topics", False))
+        self._dc_enabled           = bool(self._dc_cfg["enabled"])
+        self._images_dir           = Path(self._dc_cfg["images_dir"])
+
         self._running = False
+        # stop() wakes the loop's interval sleep instead of waiting it out; _stopped
+        # is set once start() has torn everything down after the loop exits.
+        self._wake    = threading.Event()
+        self._stopped = threading.Event()
+        self._loop_thread: int | None = None
         self._snapshot_count = 0
         self._last_frame_gray: np.ndarray | None = None
 
-        self._mqtt = MQTTClient(
-            host=self._mqtt_cfg["host"],
-            port=self._mqtt_cfg["port"],
-            client_id="souschef-scene",
-            keepalive=self._mqtt_cfg["keepalive"],
+        # Static-scene skip: with no pixel change, republish the last VLM result
+        # (stale=True) until it is older than max_stale_seconds (0 = always infer).
+        self._max_stale_seconds = self._scene_cfg.get("max_stale_seconds", 0)
+        self._last_result: DetectionResult | None = None
+        self._last_infer_ts = 0.0
+
+        # (frame_bgr, sidecar payload, base path) tuples; None is the shutdown sentinel,
+        # enqueued by _teardown() once the loop has exited
+        self._io_q: queue.Queue[tuple[np.ndarray, dict, Path] | None] = queue.Queue(
+            maxsize=_SAVE_QUEUE_SIZE
         )
+        self._writer: threading.Thread | None = None
+
+        # MQTT client + memory monitor: shared when co-located with other services
+        self._runtime = runtime or PerceptionRuntime(config, client_id="souschef-scene")
+        self._mqtt    = self._runtime.mqtt
         self._camera  = Camera()
         self._vlm     = _load_adapter(self._scene_cfg)
-        self._monitor = MemoryMonitor(
-            mqtt=self._mqtt,
-            interval_seconds=config["memory_monitor"]["interval_seconds"],
-            alert_headroom_mb=config["memory_monitor"]["alert_headroom_mb"],
-        )
-        self._monitor.register("scene")
+        self._runtime.monitor.register("scene")
 
-        Path(self._dc_cfg["images_dir"]).mkdir(parents=True, exist_ok=True)
+        self._images_dir.mkdir(parents=True, exist_ok=True)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -125,24 +171,45 @@ class SceneService:
 
     def start(self) -> None:
         self._running = True
-        self._mqtt.connect()
-        self._monitor.start()
-        self._mqtt.publish(System.HEALTH, {"subsystem": "scene", "status": "starting"})
-
-        self._vlm.load()
-        self._camera.open()
-
-        self._mqtt.publish(System.HEALTH, {"subsystem": "scene", "status": "ok"})
-        logger.info(
-            "Scene service running — snapshot every %ds  adapter=%s",
-            self._scene_cfg["snapshot_interval_seconds"],
-            self._scene_cfg.get("adapter", "moondream2"),
-        )
+        self._wake.clear()
+        self._stopped.clear()
+        self._loop_thread = threading.get_ident()
+        self._runtime.start()
+        try:
+            self._mqtt.publish(System.HEALTH, {"subsystem": "scene", "status": "starting"}, qos=1)
+
+            self._vlm.load()
+            self._camera.open()
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True, name="scene-writer")
+            self._writer.start()
+
+            self._mqtt.publish(System.HEALTH, {"subsystem": "scene", "status": "ok"}, qos=1)
+            logger.info(
+                "Scene service running — snapshot every %ds  adapter=%s",
+                self._snapshot_interval,
+                self._scene_cfg.get("adapter", "moondream2"),
+            )
 
-        self._loop()
+            self._loop()
+        finally:
+            # The loop (and its inference worker) has exited — nothing uses the
+            # model or camera any more, so release them here, not in stop().
+            self._teardown()
+            self._stopped.set()
 
     def stop(self) -> None:
+        """
+        Ask the loop to exit and wait for start() to tear down. Called on the loop's
+        own thread (a signal handler in main()), it returns at once — the caller's
+        sys.exit unwinds the loop and start() tears down on the way out.
+        """
         self._running = False
+        self._wake.set()
+        if self._loop_thread is None or self._loop_thread == threading.get_ident():
+            return
+        self._stopped.wait()
+
+    def _teardown(self) -> None:
         try:
             self._camera.close()
         except Exception:
@@ -151,96 +218,219 @@ class SceneService:
             self._vlm.unload()
         except Exception:
             pass
-        self._monitor.stop()
-        self._mqtt.disconnect()
+        if self._writer is not None:
+            # The loop has exited, so no save can land behind the sentinel. Blocking
+            # put: the writer is draining, and drop-oldest would discard a snapshot.
+            self._io_q.put(None)   # flush pending snapshots, then exit
+            self._writer.join(timeout=5)
+            self._writer = None
+        self._runtime.stop()
 
     # ------------------------------------------------------------------
     # Main loop
     # ------------------------------------------------------------------
 
     def _loop(self) -> None:
-        interval = self._scene_cfg["snapshot_interval_seconds"]
-
-        while self._running:
-            t_start = time.monotonic()
-
-            frame = self._camera.capture()
-            if frame is None:
-                logger.warning("Failed to capture frame — skipping this interval")
-                time.sleep(interval)
-                continue
-
-            # Pixel MAD change detection (fast, no VLM budget)
-            current_gray = _to_gray_array(frame)
-            change_mag, change_detected = _detect_change(current_gray, self._last_frame_gray)
-            self._last_frame_gray = current_gray
-
-            result = self._vlm.detect(frame, _PASSIVE_PROMPT)
-            self._snapshot_count += 1
-
-            low_confidence = result.confidence < self._scene_cfg["confidence_threshold"]
-
-            snapshot_payload = {
-                "description":     result.description,
-                "activity":        result.detected_label,   # COOKING, IDLE, etc.
-                "confidence":      result.confidence,
-                "low_confidence":  low_confidence,
-                "latency_ms":      result.latency_ms,
-                "snapshot_number": self._snapshot_count,
-            }
-            self._mqtt.publish(Perception.SCENE_SNAPSHOT, snapshot_payload)
-
-            if change_detected:
-                change_payload = {
-                    "change_type":      "scene_change",
-                    "description":      result.description,
-                    "change_magnitude": round(change_mag, 3),
-                    "confidence":       result.confidence,
-                }
-                self._mqtt.publish(Perception.SCENE_CHANGE, change_payload)
-                logger.info("Scene change detected (magnitude=%.3f)", change_mag)
-
-            jpeg_path = None
-            if self._dc_cfg["enabled"]:
-                jpeg_path = self._save_snapshot(frame, snapshot_payload)
-
-            # Publish context for cerebrum: text summary + JPEG path
-            context_payload = {
-                "activity":        result.detected_label,
-                "description":     result.description,
-                "confidence":      result.confidence,
-                "change_detected": change_detected,
-                "image_path":      str(jpeg_path) if jpeg_path else None,
-                "snapshot_number": self._snapshot_count,
+        interval = self._snapshot_interval
+
+        # Two-stage pipeline: detect() runs on a single worker thread while this
+        # thread captures the next frame and publishes/saves finished results.
+        # When inference outlasts the interval, the next capture overlaps it
+        # instead of waiting; otherwise results publish as soon as they're ready.
+        pending: tuple[Future, np.ndarray, float, bool] | None = None
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-vlm") as pool:
+            while self._running:
+                t_start = time.monotonic()
+
+                frame_bgr = self._camera.capture_bgr()
+                if frame_bgr is None:
+                    logger.warning("Failed to capture frame — skipping this interval")
+                    self._wake.wait(interval)
+                    continue
+
+                # Pixel MAD change detection (fast, no VLM budget) — straight off the BGR array
+                current_gray = _to_gray_array(frame_bgr)
+                change_mag, change_detected = _detect_change(current_gray, self._last_frame_gray)
+                self._last_frame_gray = current_gray
+
+                # Previous frame still in flight (inference > interval) — finish it first
+                if pending is not None:
+                    self._publish_result(pending[0].result(), *pending[1:])
+                    pending = None
+
+                if (
+                    not change_detected
+                    and self._last_result is not None
+                    and time.monotonic() - self._last_infer_ts < self._max_stale_seconds
+                ):
+                    # Static scene — skip the VLM, republish what it last saw
+                    self._publish_result(self._last_result, frame_bgr, change_mag, False, stale=True)
+                    self._sleep_remaining(interval, t_start)
+                    continue
+
+                # One RGB conversion, only for the VLM processor boundary
+                frame = Image.fromarray(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB))
+                self._last_infer_ts = time.monotonic()
+                pending = (
+                    pool.submit(self._vlm.detect, frame, _PASSIVE_PROMPT, _PASSIVE_LABELS),
+                    frame_bgr, change_mag, change_detected,
+                )
+
+                try:
+                    result = pending[0].result(timeout=max(0.0, interval - (time.monotonic() - t_start)))
+                except FuturesTimeout:
+                    # Inference is the bottleneck: go capture the next frame meanwhile
+                    continue
+                self._publish_result(result, *pending[1:])
+                pending = None
+                self._sleep_remaining(interval, t_start)
+
+            # Stopped with a frame still in flight — let it finish and publish it
+            if pending is not None:
+                try:
+                    self._publish_result(pending[0].result(), *pending[1:])
+                except Exception:
+                    logger.exception("In-flight inference failed during shutdown")
+
+    def _sleep_remaining(self, interval: float, t_start: float) -> None:
+        elapsed   = time.monotonic() - t_start
+        remaining = max(0.0, interval - elapsed)
+        logger.debug(
+            "Snapshot #%d: %.1fs inference, sleeping %.1fs",
+            self._snapshot_count, elapsed, remaining,
+        )
+        if remaining > 0:
+            self._wake.wait(remaining)
+
+    def _publish_result(
+        self,
+        result: DetectionResult,
+        frame_bgr: np.ndarray,
+        change_mag: float,
+        change_detected: bool,
+        stale: bool = False,
+    ) -> None:
+        """
+        Publish (and queue for saving) one VLM result. stale=True republishes a
+        cached result for an unchanged frame; it is not saved for data collection.
+        """
+        self._snapshot_count += 1
+        if not stale:
+            self._last_result = result
+
+        low_confidence = result.confidence < self._confidence_threshold
+
+        snapshot_payload = {
+            "description":     result.description,
+            "activity":        result.detected_label,   # COOKING, IDLE, etc.
+            "confidence":      result.confidence,
+            "low_confidence":  low_confidence,
+            "latency_ms":      result.latency_ms,
+            "snapshot_number": self._snapshot_count,
+            "stale":           stale,   # True = cached result, VLM skipped on an unchanged frame
+        }
+
+        change_payload = None
+        if change_detected:
+            change_payload = {
+                "change_type":      "scene_change",
+                "change_magnitude": round(change_mag, 3),
+                "confidence":       result.confidence,
             }
-            self._mqtt.publish(Perception.SCENE_CONTEXT, context_payload)
-
-            elapsed   = time.monotonic() - t_start
-            remaining = max(0.0, interval - elapsed)
-            logger.debug(
-                "Snapshot #%d: %.1fs inference, sleeping %.1fs",
-                self._snapshot_count, elapsed, remaining,
+            logger.info("Scene change detected (magnitude=%.3f)", change_mag)
+
+        jpeg_path = None
+        if self._dc_enabled and not stale:
+            jpeg_path = self._save_snapshot(frame_bgr, snapshot_payload)
+
+        # Context for cerebrum: text summary + JPEG path
+        context_payload = {
+            "activity":        result.detected_label,
+            "confidence":      result.confidence,
+            "change_detected": change_detected,
+            "image_path":      str(jpeg_path) if jpeg_path else None,
+            "snapshot_number": self._snapshot_count,
+        }
+
+        # One combined message per snapshot instead of up to three. The description
+        # (the bulk of the bytes) is carried once, in snapshot. Telemetry goes out
+        # at QoS 0; anything carrying a scene change at QoS 1.
+        change_qos = 1 if change_payload is not None else 0
+        messages = [(Perception.SCENE_UPDATE, {
+            "snapshot": snapshot_payload,
+            "context":  context_payload,
+            "change":   change_payload,
+        }, change_qos)]
+        if self._publish_legacy:
+            messages.append((Perception.SCENE_SNAPSHOT, snapshot_payload))
+            if change_payload is not None:
+                messages.append(
+                    (Perception.SCENE_CHANGE, {**change_payload, "description": result.description}, 1)
+                )
+            messages.append(
+                (Perception.SCENE_CONTEXT, {**context_payload, "description": result.description})
             )
-            if remaining > 0:
-                time.sleep(remaining)
+        self._mqtt.publish_batch(messages)
 
     # ------------------------------------------------------------------
     # Data collection
     # ------------------------------------------------------------------
 
-    def _save_snapshot(self, frame, payload: dict) -> Path:
+    def _save_snapshot(self, frame_bgr: np.ndarray, payload: dict) -> Path:
+        """
+        Queue a snapshot for the background writer and return its JPEG path.
+        The path is decided here so it can be published before the file lands.
+        """
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-        base = Path(self._dc_cfg["images_dir"]) / ts
-
+        base = self._images_dir / ts
+        # Copy the payload — the loop keeps using (and publish() mutates) the original
+        self._enqueue_save((frame_bgr, dict(payload), base))
+        return base.with_suffix(".jpg")
+
+    def _enqueue_save(self, item: tuple[np.ndarray, dict, Path]) -> None:
+        """Enqueue without blocking; on a full queue drop the oldest — recency wins for a scene monitor."""
+        while True:
+            try:
+                self._io_q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    dropped = self._io_q.get_nowait()
+                except queue.Empty:
+                    continue
+                logger.warning("Snapshot writer behind — dropped %s", dropped[2].name)
+
+    def _writer_loop(self) -> None:
+        while True:
+            item = self._io_q.get()
+            if item is None:
+                return
+            frame_bgr, payload, base = item
+            try:
+                self._write_snapshot(frame_bgr, payload, base)
+            except Exception:
+                logger.exception("Failed to save snapshot %s", base.name)
+
+    def _write_snapshot(self, frame_bgr: np.ndarray, payload: dict, base: Path) -> None:
+        # OpenCV's wheels bundle libjpeg-turbo (SIMD DCT): encode straight from the
+        # BGR array in memory, then one write. Disk errors surface as-is; only an
+        # encoder failure falls back to PIL.
         jpeg_path = base.with_suffix(".jpg")
-        frame.save(str(jpeg_path), "JPEG", quality=85)
+        ok, jpeg = cv2.imencode(".jpg", frame_bgr, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if ok:
+            jpeg_path.write_bytes(jpeg)
+        else:
+            logger.warning("cv2.imencode failed for %s — falling back to PIL", jpeg_path)
+            Image.fromarray(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)).save(
+                str(jpeg_path), "JPEG", quality=85
+            )
 
         meta_path = base.with_suffix(".json")
         with open(meta_path, "w") as f:
             json.dump(payload, f, indent=2)
 
         logger.debug("Saved snapshot: %s", jpeg_path)
-        return jpeg_path
 
 
 # ------------------------------------------------------------------
@@ -3,7 +3,7 @@ Perception service — the main runnable for Phase A audio perception.
 
 Pipeline:
   sounddevice stream
-    → SileroVAD (per 512-sample chunk)
+    → SileroVAD (per 512-sample chunk; queued backlog scored in one call)
     → VAD state machine (WAITING / SPEAKING / SILENCE)
     → WhisperSTT (on utterance end)
     → MQTT publish (perception/speech/transcript)
@@ -15,7 +15,6 @@ Run with:
 
 import json
 import logging
-import queue
 import signal
 import sys
 import threading
@@ -28,10 +27,9 @@ import numpy as np
 import sounddevice as sd
 import yaml
 
-from src.debug.memory_monitor import MemoryMonitor
+from src.perception.runtime import PerceptionRuntime
 from src.perception.stt import WhisperSTT
 from src.perception.vad import SileroVAD
-from src.transport.client import MQTTClient
 from src.transport.topics import Perception, System
 
 logger = logging.getLogger(__name__)
@@ -43,6 +41,54 @@ _WAITING  = "WAITING"
 _SPEAKING = "SPEAKING"
 _SILENCE  = "SILENCE"
 
+_VAD_DRAIN_MAX = 4   # max queued chunks scored per VAD call
+_AUDIO_RING_SLOTS = 512   # ~16s of 32ms chunks — headroom while STT runs
+
+
+class _AudioRing:
+    """
+    Single-producer / single-consumer ring of fixed-size audio chunks.
+
+    The sounddevice callback writes straight into a preallocated slot and bumps
+    head; the processing loop reads slot views and bumps tail once it's done
+    with them. Each index has one writer and int rebinding is atomic under the
+    GIL, so no locks are needed — an Event only wakes an idle consumer.
+    """
+
+    def __init__(self, slots: int, chunk_size: int) -> None:
+        self._buf = np.empty((slots, chunk_size), dtype=np.float32)
+        self._slots = slots
+        self._head = 0      # next slot to write (producer only)
+        self._tail = 0      # next slot to read (consumer only)
+        self._event = threading.Event()
+        self.dropped = 0    # chunks discarded because the consumer fell a full ring behind
+
+    def put(self, chunk: np.ndarray) -> None:
+        """Producer side (audio callback). Drops the chunk if the ring is full."""
+        if self._head - self._tail >= self._slots:
+            self.dropped += 1
+            return
+        self._buf[self._head % self._slots] = chunk
+        self._head += 1
+        self._event.set()
+
+    def peek(self, max_chunks: int, timeout: float) -> list[np.ndarray]:
+        """
+        Consumer side: views of up to max_chunks pending slots, oldest first
+        ([] on timeout). Views stay valid until release().
+        """
+        if self._tail == self._head:
+            self._event.clear()
+            # Re-check after clear so a put() between the test and clear() isn't missed
+            if self._tail == self._head and not self._event.wait(timeout):
+                return []
+        n = min(self._head - self._tail, max_chunks)
+        return [self._buf[(self._tail + i) % self._slots] for i in range(n)]
+
+    def release(self, n: int) -> None:
+        """Consumer side: hand n slots back to the producer."""
+        self._tail += n
+
 
 def load_config(path: str = "config/default.yaml") -> dict:
     with open(path) as f:
@@ -50,39 +96,46 @@ def load_config(path: str = "config/default.yaml") -> dict:
 
 
 class PerceptionService:
-    def __init__(self, config: dict) -> None:
+    def __init__(self, config: dict, runtime: PerceptionRuntime | None = None) -> None:
         self._cfg = config
         self._audio_cfg = config["audio"]
         self._vad_cfg   = config["vad"]
         self._stt_cfg   = config["stt"]
-        self._mqtt_cfg  = config["mqtt"]
         self._dc_cfg    = config["data_collection"]
 
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
+        # Per-utterance settings, resolved once instead of dict lookups per utterance
+        self._sample_rate          = int(self._audio_cfg["sample_rate"])
+        self._confidence_threshold = float(self._stt_cfg["confidence_threshold"])
+        self._dc_enabled           = bool(self._dc_cfg["enabled"])
+        self._dc_save_all          = bool(self._dc_cfg.get("save_all", True))
+        self._audio_dir            = Path(self._dc_cfg["audio_dir"])
+
+        self._audio_ring = _AudioRing(_AUDIO_RING_SLOTS, self._audio_cfg["chunk_size"])
         self._running = False
 
-        # Initialise subsystems
-        self._mqtt = MQTTClient(
-            host=self._mqtt_cfg["host"],
-            port=self._mqtt_cfg["port"],
-            client_id=self._mqtt_cfg["client_id"],
-            keepalive=self._mqtt_cfg["keepalive"],
-        )
+        # Utterance audio is written in place into one buffer allocated up front
+        # (max_speech_seconds, rounded up to whole chunks — the cap is checked
+        # after a chunk is appended) instead of a list of chunks + concatenate.
+        chunk_size  = self._audio_cfg["chunk_size"]
+        max_samples = int(self._vad_cfg["max_speech_seconds"] * self._sample_rate)
+        self._speech_buf = np.empty(-(-max_samples // chunk_size) * chunk_size, dtype=np.float32)
+        self._int16_scratch = np.empty(len(self._speech_buf), dtype=np.int16)   # WAV encode in _save_audio
+        self._write_idx = 0   # samples of the current utterance in _speech_buf
+
+        # Initialise subsystems. MQTT client + memory monitor come from the
+        # runtime — shared when co-located with the scene service.
+        self._runtime = runtime or PerceptionRuntime(config)
+        self._mqtt = self._runtime.mqtt
         self._vad = SileroVAD()
         self._stt = WhisperSTT(
             model=self._stt_cfg["model"],
             language=self._stt_cfg["language"],
         )
-        self._monitor = MemoryMonitor(
-            mqtt=self._mqtt,
-            interval_seconds=config["memory_monitor"]["interval_seconds"],
-            alert_headroom_mb=config["memory_monitor"]["alert_headroom_mb"],
-        )
-        self._monitor.register("perception")
+        self._runtime.monitor.register("perception")
 
         # Ensure data collection dir exists
-        if self._dc_cfg["enabled"]:
-            Path(self._dc_cfg["audio_dir"]).mkdir(parents=True, exist_ok=True)
+        if self._dc_enabled:
+            self._audio_dir.mkdir(parents=True, exist_ok=True)
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -90,20 +143,19 @@ class PerceptionService:
 
     def start(self) -> None:
         self._running = True
-        self._mqtt.connect()
-        self._monitor.start()
+        self._runtime.start()
 
-        self._mqtt.publish(System.HEALTH, {"subsystem": "perception", "status": "starting"})
+        self._mqtt.publish(System.HEALTH, {"subsystem": "perception", "status": "starting"}, qos=1)
         logger.info("Perception service starting — listening for speech...")
 
-        sample_rate  = self._audio_cfg["sample_rate"]
+        sample_rate  = self._sample_rate
         chunk_size   = self._audio_cfg["chunk_size"]
 
         def audio_callback(indata: np.ndarray, frames: int, time_info, status) -> None:
             if status:
                 logger.warning("sounddevice status: %s", status)
-            # indata is (chunk_size, channels); take channel 0, squeeze to 1-D
-            self._audio_queue.put(indata[:, 0].copy())
+            # indata is (chunk_size, channels); channel 0 is copied into a ring slot
+            self._audio_ring.put(indata[:, 0])
 
         with sd.InputStream(
             samplerate=sample_rate,
@@ -112,22 +164,19 @@ class PerceptionService:
             blocksize=chunk_size,
             callback=audio_callback,
         ):
-            self._mqtt.publish(System.HEALTH, {"subsystem": "perception", "status": "ok"})
+            self._mqtt.publish(System.HEALTH, {"subsystem": "perception", "status": "ok"}, qos=1)
             self._process_loop()
 
     def stop(self) -> None:
         self._running = False
-        self._monitor.stop()
-        self._mqtt.disconnect()
+        self._runtime.stop()
 
     # ------------------------------------------------------------------
     # Main processing loop
     # ------------------------------------------------------------------
 
     def _process_loop(self) -> None:
-        sample_rate   = self._audio_cfg["sample_rate"]
-        chunk_size    = self._audio_cfg["chunk_size"]
-        max_samples   = int(self._vad_cfg["max_speech_seconds"] * sample_rate)
+        max_samples   = int(self._vad_cfg["max_speech_seconds"] * self._sample_rate)
 
         onset_threshold  = self._vad_cfg["threshold_onset"]
         offset_threshold = self._vad_cfg["threshold_offset"]
@@ -135,67 +184,88 @@ class PerceptionService:
         silence_frames_needed = self._vad_cfg["silence_frames"]
 
         state = _WAITING
-        speech_buffer: list[np.ndarray] = []
+        speech_buf = self._speech_buf
+        self._write_idx = 0
         onset_counter  = 0
         silence_counter = 0
 
+        ring = self._audio_ring
+        dropped_seen = 0
+
         while self._running:
-            try:
-                chunk = self._audio_queue.get(timeout=1.0)
-            except queue.Empty:
+            # Take whatever is already queued (backlog builds up while STT runs)
+            # and score it under one no_grad scope
+            chunks = ring.peek(_VAD_DRAIN_MAX, timeout=1.0)
+            if not chunks:
                 continue
+            if ring.dropped != dropped_seen:
+                logger.warning("Audio ring overflow — %d chunks dropped so far", ring.dropped)
+                dropped_seen = ring.dropped
+            probs = self._vad.speech_probabilities(chunks)
+
+            for i, chunk in enumerate(chunks):
+                prob = probs[i]
+                vad_reset = False
+
+                if state == _WAITING:
+                    if prob >= onset_threshold:
+                        onset_counter += 1
+                        if onset_counter >= min_speech_frames:
+                            state = _SPEAKING
+                            self._write_idx = 0
+                            silence_counter = 0
+                            onset_counter = 0
+                            self._publish_vad(is_speaking=True)
+                            logger.debug("VAD: speech started")
+                    else:
+                        onset_counter = 0
 
-            prob = self._vad.speech_probability(chunk)
-
-            if state == _WAITING:
-                if prob >= onset_threshold:
-                    onset_counter += 1
-                    if onset_counter >= min_speech_frames:
-                        state = _SPEAKING
-                        speech_buffer = []
+                elif state == _SPEAKING:
+                    n = len(chunk)
+                    speech_buf[self._write_idx:self._write_idx + n] = chunk
+                    self._write_idx += n
+
+                    if prob < offset_threshold:
+                        silence_counter += 1
+                        if silence_counter >= silence_frames_needed:
+                            # End of utterance
+                            logger.debug("VAD: speech ended (%d samples buffered)", self._write_idx)
+                            self._end_utterance()
+                            state = _WAITING
+                            vad_reset = True
+                            silence_counter = 0
+                            onset_counter = 0
+                    else:
                         silence_counter = 0
-                        onset_counter = 0
-                        self._publish_vad(is_speaking=True)
-                        logger.debug("VAD: speech started")
-                else:
-                    onset_counter = 0
-
-            elif state == _SPEAKING:
-                speech_buffer.append(chunk)
-
-                if prob < offset_threshold:
-                    silence_counter += 1
-                    if silence_counter >= silence_frames_needed:
-                        # End of utterance
+
+                    # Hard cap — force transcription if buffer grows too long
+                    if self._write_idx >= max_samples:
+                        logger.warning("VAD: max speech duration reached — forcing transcription")
+                        self._end_utterance()
                         state = _WAITING
-                        self._publish_vad(is_speaking=False)
-                        self._vad.reset_states()
-                        logger.debug("VAD: speech ended (%d chunks buffered)", len(speech_buffer))
-                        self._handle_utterance(speech_buffer)
-                        speech_buffer = []
+                        vad_reset = True
                         silence_counter = 0
                         onset_counter = 0
-                else:
-                    silence_counter = 0
-
-                # Hard cap — force transcription if buffer grows too long
-                buffered_samples = len(speech_buffer) * chunk_size
-                if buffered_samples >= max_samples:
-                    logger.warning("VAD: max speech duration reached — forcing transcription")
-                    state = _WAITING
-                    self._publish_vad(is_speaking=False)
-                    self._vad.reset_states()
-                    self._handle_utterance(speech_buffer)
-                    speech_buffer = []
-                    silence_counter = 0
-                    onset_counter = 0
+
+                # Chunks after a reset were scored against the pre-reset state — rescore them
+                if vad_reset and i + 1 < len(chunks):
+                    probs[i + 1:] = self._vad.speech_probabilities(chunks[i + 1:])
+
+            ring.release(len(chunks))
 
     # ------------------------------------------------------------------
     # Utterance handling
     # ------------------------------------------------------------------
 
-    def _handle_utterance(self, chunks: list[np.ndarray]) -> None:
-        audio = np.concatenate(chunks)
+    def _end_utterance(self) -> None:
+        """Close out the buffered utterance: VAD off, reset Silero state, transcribe the buffer in place."""
+        self._publish_vad(is_speaking=False)
+        self._vad.reset_states()
+        self._handle_utterance(self._speech_buf[:self._write_idx])
+        self._write_idx = 0
+
+    def _handle_utterance(self, audio: np.ndarray) -> None:
+        """audio is a view into the reusable speech buffer — valid only for this call."""
         result = self._stt.transcribe(audio)
 
         if not result.text:
@@ -207,7 +277,7 @@ class PerceptionService:
             result.text, result.confidence, result.no_speech_prob,
         )
 
-        low_confidence = result.confidence < self._stt_cfg["confidence_threshold"]
+        low_confidence = result.confidence < self._confidence_threshold
 
         payload = {
             "text":               result.text,
@@ -219,9 +289,8 @@ class PerceptionService:
         }
         self._mqtt.publish(Perception.TRANSCRIPT, payload)
 
-        if self._dc_cfg["enabled"]:
-            save_all = self._dc_cfg.get("save_all", True)
-            if save_all or low_confidence:
+        if self._dc_enabled:
+            if self._dc_save_all or low_confidence:
                 self._save_audio(audio, payload)
 
     def _publish_vad(self, is_speaking: bool) -> None:
@@ -230,16 +299,17 @@ class PerceptionService:
     def _save_audio(self, audio: np.ndarray, transcript_payload: dict) -> None:
         """Save audio WAV + transcript JSON sidecar for the fine-tuning flywheel."""
         ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
-        base = Path(self._dc_cfg["audio_dir"]) / ts
+        base = self._audio_dir / ts
 
         # WAV
         wav_path = base.with_suffix(".wav")
-        audio_int16 = (audio * 32767).astype(np.int16)
+        audio_int16 = self._int16_scratch[:len(audio)]
+        np.multiply(audio, 32767, out=audio_int16, casting="unsafe")   # truncates like astype(int16)
         with wave.open(str(wav_path), "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)   # 16-bit
-            wf.setframerate(self._audio_cfg["sample_rate"])
-            wf.writeframes(audio_int16.tobytes())
+            wf.setframerate(self._sample_rate)
+            wf.writeframes(audio_int16)
 
         # Sidecar JSON
         meta_path = base.with_suffix(".json")
@@ -50,8 +50,13 @@ class WhisperSTT:
         segments = result.get("segments", [])
 
         if segments:
-            avg_logprob   = float(np.mean([s.get("avg_logprob", -1.0) for s in segments]))
-            no_speech_prob = float(np.mean([s.get("no_speech_prob", 0.0) for s in segments]))
+            # One pass over a handful of segments — no intermediate lists/arrays per utterance
+            sum_logprob = sum_nsp = 0.0
+            for s in segments:
+                sum_logprob += s.get("avg_logprob", -1.0)
+                sum_nsp     += s.get("no_speech_prob", 0.0)
+            avg_logprob    = sum_logprob / len(segments)
+            no_speech_prob = sum_nsp / len(segments)
         else:
             avg_logprob    = -1.0
             no_speech_prob = 1.0   # no segments → treat as silence
@@ -67,7 +72,9 @@ class WhisperSTT:
         )
 
     def _warmup(self) -> None:
-        silence = np.zeros(16000, dtype=np.float32)   # 1 second of silence
+        # 100 ms is enough to load weights and exercise the encoder/decoder
+        # kernels; mlx-whisper pads every input to a 30 s mel window anyway.
+        silence = np.zeros(1600, dtype=np.float32)
         self._mlx_whisper.transcribe(
             silence,
             path_or_hf_repo=self._model_path,
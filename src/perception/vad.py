@@ -25,6 +25,10 @@ class SileroVAD:
         from silero_vad import load_silero_vad
         self._model = load_silero_vad()
         self._model.eval()
+        # One persistent input tensor; chunks are copied into its numpy view
+        # instead of allocating (and dtype-converting) a tensor per chunk.
+        self._buf = torch.empty(_CHUNK_SAMPLES, dtype=torch.float32)
+        self._buf_np = self._buf.numpy()
         logger.info("Silero VAD loaded")
 
     def speech_probability(self, chunk: np.ndarray) -> float:
@@ -35,11 +39,29 @@ class SileroVAD:
         if len(chunk) != _CHUNK_SAMPLES:
             raise ValueError(f"VAD expects {_CHUNK_SAMPLES} samples, got {len(chunk)}")
 
-        tensor = torch.from_numpy(chunk).float()
+        np.copyto(self._buf_np, chunk, casting="unsafe")
         with torch.no_grad():
-            prob = self._model(tensor, _SAMPLE_RATE).item()
+            prob = self._model(self._buf, _SAMPLE_RATE).item()
         return float(prob)
 
+    def speech_probabilities(self, chunks: list[np.ndarray]) -> list[float]:
+        """
+        Speech probabilities for consecutive chunks of the same stream, in order.
+
+        Silero is recurrent — each chunk conditions on the state left by the
+        previous one — so chunks run sequentially inside a single no_grad scope
+        rather than as a [B, 512] batch (the model treats a batch as B
+        independent streams).
+        """
+        probs: list[float] = []
+        with torch.no_grad():
+            for chunk in chunks:
+                if len(chunk) != _CHUNK_SAMPLES:
+                    raise ValueError(f"VAD expects {_CHUNK_SAMPLES} samples, got {len(chunk)}")
+                np.copyto(self._buf_np, chunk, casting="unsafe")
+                probs.append(float(self._model(self._buf, _SAMPLE_RATE).item()))
+        return probs
+
     def reset_states(self) -> None:
         """Call between utterances to clear Silero's internal hidden state."""
         self._model.reset_states()
@@ -7,11 +7,15 @@ The caller (detect_event.py, scene_service.py) is decoupled from the model.
 Adding a new model = implement VLMAdapter, add to ADAPTER_REGISTRY.
 """
 
+import logging
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 from PIL import Image
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class DetectionResult:
@@ -30,6 +34,92 @@ class DetectionResult:
     image_path: str | None = None
 
 
+def fit_within(image: Image.Image, max_edge: int) -> Image.Image:
+    """
+    Downscale so the longer edge is at most max_edge, keeping aspect ratio.
+    Never upscales. Uses OpenCV INTER_AREA (SIMD box filter) on the pixel buffer.
+    """
+    w, h = image.size
+    scale = max_edge / max(w, h)
+    if scale >= 1.0:
+        return image
+
+    import cv2
+    import numpy as np
+
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return Image.fromarray(cv2.resize(np.asarray(image), size, interpolation=cv2.INTER_AREA))
+
+
+def load_pretrained(model_cls, model_id: str, device: str, quantization: str | None = None,
+                    dtype="auto", **kwargs):
+    """
+    model_cls.from_pretrained() onto device, int8-quantized when requested.
+    Decoding is memory-bound, so int8 roughly halves bytes moved per token.
+      cuda: bitsandbytes 8-bit at load time
+      cpu:  torch dynamic int8 on nn.Linear after a float32 load
+      mps:  no torch int8 kernels (dynamic-quantized ops fall back to CPU) — loads dtype
+    """
+    import torch
+
+    if quantization not in (None, "int8"):
+        raise ValueError(f"Unknown quantization '{quantization}'. Valid options: int8")
+    if quantization and device == "cuda":
+        from transformers import BitsAndBytesConfig
+        return model_cls.from_pretrained(
+            model_id,
+            quantization_config=BitsAndBytesConfig(load_in_8bit=True),
+            device_map=device,
+            **kwargs,
+        )
+    if quantization and device == "cpu":
+        model = model_cls.from_pretrained(model_id, dtype=torch.float32, **kwargs)
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if quantization:
+        logger.warning("int8 quantization is not supported on %s — loading dtype=%s "
+                       "(use an mlx-vlm adapter for quantized weights on Apple Silicon)",
+                       device, dtype)
+    return model_cls.from_pretrained(model_id, dtype=dtype, **kwargs).to(device)
+
+
+# First all-caps word >= 3 chars (excludes "A", "I", "OK", etc.)
+_LABEL_RE = re.compile(r'\b([A-Z_]{3,})\b')
+_LABEL_PUNCT = ".,:;!?-*\"'()[]`"   # stripped from tokens before known-label lookup
+
+
+def parse_label(text: str, labels: frozenset[str] | None = None) -> tuple[str, float]:
+    """
+    Extract the label from a VLM response. Shared by all adapters.
+
+    Models are instructed to respond with the label first, in ALL_CAPS. With a
+    known label set, the first response token in it is the label
+    (confidence=1.0). Otherwise take the first all-caps word ≥ 3 chars;
+    confidence=1.0 if found without a label set, 0.5 if it is not a known
+    label or only a best-effort match.
+    """
+    if labels:
+        for token in text.split():
+            token = token.strip(_LABEL_PUNCT)
+            if token in labels:
+                return token, 1.0
+    found_conf = 0.5 if labels else 1.0
+
+    # Fast path: the model obeyed and led with the label (same result the regex gives)
+    parts = text.split(None, 1)
+    first = parts[0] if parts else ""
+    if len(first) >= 3 and first.isascii() and first.replace("_", "").isalpha() and first.isupper():
+        return first, found_conf
+
+    match = _LABEL_RE.search(text)
+    if match:
+        return match.group(1), found_conf
+
+    # Fallback: return first word uppercased as the label, low confidence
+    return (first.upper() if first else "UNKNOWN"), 0.5
+
+
 class VLMAdapter(ABC):
     """
     Abstract VLM adapter. Inject prompt at detect() call time — no static prompts.
@@ -46,9 +136,17 @@ class VLMAdapter(ABC):
         ...
 
     @abstractmethod
-    def detect(self, image: Image.Image, prompt: str) -> DetectionResult:
+    def detect(
+        self,
+        image: Image.Image,
+        prompt: str,
+        labels: frozenset[str] | None = None,
+    ) -> DetectionResult:
         """
         Run a single VLM inference on image with the given prompt.
         Returns DetectionResult including latency_ms for performance tracking.
+
+        labels: the label set the prompt asks for. When given, a response token
+        in the set is the label (confidence 1.0); any other parse is 0.5.
         """
         ...
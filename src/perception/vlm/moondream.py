@@ -12,6 +12,17 @@ Model: vikhyatk/moondream2 (loaded via transformers + trust_remote_code)
 RAM:   ~1.8 GB on MPS
 FPS:   ~1-3 fps on M2 Pro (estimated; measure with evaluate_vlm.py)
 
+Memory: the MPS caching allocator keeps freed blocks, so resident memory climbs
+over long runs. detect() calls torch.mps.empty_cache() every _CACHE_TRIM_EVERY
+frames to keep it flat. PYTORCH_MPS_HIGH_WATERMARK_RATIO (default 1.7 of the
+recommended working set) sets where MPS allocation hard-fails; 0.0 removes the
+limit entirely — no OOM abort, but the system may swap heavily instead.
+
+Quantization: quantization="int8" loads bitsandbytes 8-bit weights on CUDA and
+torch dynamic int8 nn.Linear on CPU. MPS has no torch int8 kernels (dynamic
+quantized ops fall back to CPU), so it loads native dtype. A quantized model
+that fails warmup is reloaded unquantized.
+
 Prompt design: Moondream2 responds well to direct question format. For event
 detection, we use structured classification prompts that request a specific
 label from a known list — easier to parse reliably than free-form description.
@@ -22,7 +33,7 @@ import time
 
 from PIL import Image
 
-from src.perception.vlm.base import DetectionResult, VLMAdapter
+from src.perception.vlm.base import DetectionResult, VLMAdapter, fit_within, load_pretrained, parse_label
 
 logger = logging.getLogger(__name__)
 
@@ -32,18 +43,41 @@ logger = logging.getLogger(__name__)
 _DEFAULT_MODEL_ID = "vikhyatk/moondream2"
 _DEFAULT_REVISION  = "2025-01-09"
 
+# Dummy query at the end of load() so first-seen-shape kernel setup happens at
+# startup instead of on the first real frame.
+_WARMUP_IMAGE_SIZE = (512, 512)
+
+# Moondream2's vision encoder works on 378x378 crops; larger inputs add local
+# crops (more encoder passes) on top of the global one. Frames are downscaled
+# once to the native crop edge before encode_image. (Not done for InternVL2 —
+# its token count is resolution-independent; see LESSONS_LEARNED.)
+_MAX_INPUT_EDGE = 378
+
+_CACHE_TRIM_EVERY = 16   # detect() calls between MPS/CUDA allocator cache trims
+
 
 class MoondreamAdapter(VLMAdapter):
     def __init__(
         self,
         model_id: str = _DEFAULT_MODEL_ID,
         revision: str = _DEFAULT_REVISION,
+        max_input_edge: int | None = _MAX_INPUT_EDGE,
+        quantization: str | None = None,
     ) -> None:
+        """max_input_edge=None passes frames through at full resolution. quantization: None | "int8"."""
+        if quantization not in (None, "int8"):
+            raise ValueError(f"Unknown quantization '{quantization}'. Valid options: int8")
         self._model_id = model_id
         self._revision = revision
+        self._max_input_edge = max_input_edge
+        self._quantization   = quantization
         self._model     = None
         self._tokenizer = None
         self._device    = None
+        # Bound model methods, set in load() — skips nn.Module.__getattr__ per frame
+        self._encode_image = None
+        self._query        = None
+        self._n_since_trim = 0
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -52,7 +86,7 @@ class MoondreamAdapter(VLMAdapter):
     def load(self) -> None:
         """Load Moondream2 onto MPS (Apple Silicon) or CPU fallback."""
         import torch
-        from transformers import AutoModelForCausalLM, AutoTokenizer
+        from transformers import AutoTokenizer
 
         if torch.backends.mps.is_available():
             self._device = "mps"
@@ -62,7 +96,8 @@ class MoondreamAdapter(VLMAdapter):
             self._device = "cpu"
             logger.warning("No GPU available — Moondream2 will run on CPU (expect ~5-10s/frame)")
 
-        logger.info("Loading Moondream2 on %s: %s @ %s", self._device, self._model_id, self._revision)
+        logger.info("Loading Moondream2 on %s: %s @ %s (quantization=%s)",
+                    self._device, self._model_id, self._revision, self._quantization)
 
         kwargs = dict(revision=self._revision) if self._revision else {}
 
@@ -71,16 +106,57 @@ class MoondreamAdapter(VLMAdapter):
             trust_remote_code=True,
             **kwargs,
         )
-        self._model = AutoModelForCausalLM.from_pretrained(
+        self._model = self._load_weights(self._quantization, kwargs)
+        self._model.eval()
+
+        logger.info("Moondream2 loaded — device=%s", self._device)
+        self._bind_model()
+        quantized = self._quantization is not None and self._device in ("cuda", "cpu")
+        if self._warmup() or not quantized:
+            return
+
+        # Moondream2's remote code reads Linear weights directly; if a quantized
+        # layer type breaks that, run unquantized rather than fail every frame.
+        logger.error("Moondream2 int8 model failed warmup — reloading native dtype")
+        del self._model
+        self._model = self._load_weights(None, kwargs)
+        self._model.eval()
+        self._bind_model()
+        self._warmup()
+
+    def _bind_model(self) -> None:
+        self._encode_image = self._model.encode_image
+        self._query        = self._model.query
+
+    def _load_weights(self, quantization: str | None, kwargs: dict):
+        from transformers import AutoModelForCausalLM
+
+        return load_pretrained(
+            AutoModelForCausalLM,
             self._model_id,
+            self._device,
+            quantization,
             trust_remote_code=True,
-            dtype="auto",
             attn_implementation="eager",   # Moondream2 does not support SDPA
             **kwargs,
-        ).to(self._device)
-        self._model.eval()
+        )
 
-        logger.info("Moondream2 loaded — device=%s", self._device)
+    def _warmup(self) -> bool:
+        import torch
+
+        t0 = time.monotonic()
+        try:
+            enc_image = self._encode_image(Image.new("RGB", _WARMUP_IMAGE_SIZE, (128, 128, 128)))
+            self._query(enc_image, "Describe the image.")
+            if self._device == "mps":
+                torch.mps.synchronize()
+            elif self._device == "cuda":
+                torch.cuda.synchronize()
+        except Exception:
+            logger.warning("Moondream2 warmup failed — first frame will pay warmup cost", exc_info=True)
+            return False
+        logger.info("Moondream2 warmup done in %.0fms", (time.monotonic() - t0) * 1000)
+        return True
 
     def unload(self) -> None:
         import torch
@@ -88,6 +164,8 @@ class MoondreamAdapter(VLMAdapter):
         del self._tokenizer
         self._model = None
         self._tokenizer = None
+        self._encode_image = None
+        self._query        = None
         if self._device == "mps":
             torch.mps.empty_cache()
         elif self._device == "cuda":
@@ -98,7 +176,12 @@ class MoondreamAdapter(VLMAdapter):
     # Inference
     # ------------------------------------------------------------------
 
-    def detect(self, image: Image.Image, prompt: str) -> DetectionResult:
+    def detect(
+        self,
+        image: Image.Image,
+        prompt: str,
+        labels: frozenset[str] | None = None,
+    ) -> DetectionResult:
         """
         Run Moondream2 on image with the given classification prompt.
 
@@ -115,12 +198,15 @@ class MoondreamAdapter(VLMAdapter):
 
         t0 = time.monotonic()
 
-        enc_image = self._model.encode_image(image)
-        raw_answer: str = self._model.query(enc_image, prompt)["answer"].strip()
+        if self._max_input_edge:
+            image = fit_within(image, self._max_input_edge)
+        enc_image = self._encode_image(image)
+        raw_answer: str = self._query(enc_image, prompt)["answer"].strip()
 
         latency_ms = (time.monotonic() - t0) * 1000.0
+        self._maybe_trim_cache()   # after timing — not part of inference latency
 
-        detected_label, confidence = _parse_label(raw_answer)
+        detected_label, confidence = parse_label(raw_answer, labels)
 
         logger.info(
             "Moondream2: label=%s  conf=%.1f  latency=%.0fms",
@@ -136,25 +222,15 @@ class MoondreamAdapter(VLMAdapter):
             latency_ms=round(latency_ms, 1),
         )
 
+    def _maybe_trim_cache(self) -> None:
+        """Release cached allocator blocks every _CACHE_TRIM_EVERY frames."""
+        self._n_since_trim += 1
+        if self._n_since_trim < _CACHE_TRIM_EVERY:
+            return
+        self._n_since_trim = 0
 
-# ------------------------------------------------------------------
-# Helpers
-# ------------------------------------------------------------------
-
-def _parse_label(text: str) -> tuple[str, float]:
-    """
-    Extract the first all-caps token from VLM response.
-
-    Moondream2 is instructed to respond with the label first. We extract the
-    first word that is entirely uppercase (and at least 3 chars long) as the label.
-    confidence=1.0 if found, 0.5 if only a best-effort match.
-    """
-    import re
-    # Look for first all-caps word >= 3 chars (excludes "A", "I", "OK", etc.)
-    match = re.search(r'\b([A-Z_]{3,})\b', text)
-    if match:
-        return match.group(1), 1.0
-
-    # Fallback: return first word uppercased as the label, low confidence
-    first_word = text.split()[0].upper() if text else "UNKNOWN"
-    return first_word, 0.5
+        import torch
+        if self._device == "mps":
+            torch.mps.empty_cache()
+        elif self._device == "cuda":
+            torch.cuda.empty_cache()
@@ -0,0 +1,267 @@
+"""
+VLM model server — keeps the scene VLM loaded across scene_service restarts.
+
+Loading weights costs ~10-20s per process start. This sidecar loads the
+configured adapter (scene.adapter) once and serves detect() over a Unix-domain
+socket; with scene.vlm_server: true, SceneService talks to it through
+VLMClient, whose load() only opens the socket.
+
+Protocol (one request in flight per connection):
+  client → server  JSON header line {"op": "detect", "prompt": ..., "labels": [...] | null,
+                                    "shape": [h, w, 3]}
+                   + the RGB frame in a memfd, passed as SCM_RIGHTS ancillary data
+  server → client  JSON line: DetectionResult fields, or {"error": "..."}
+
+Frames never go through the socket itself — the server maps the passed fd.
+On macOS (no memfd_create) an unlinked temp file stands in for the memfd.
+
+Run with:
+  python -m src.perception.vlm_server
+"""
+
+import json
+import logging
+import mmap
+import os
+import signal
+import socket
+import sys
+import tempfile
+from dataclasses import asdict
+
+import numpy as np
+from PIL import Image
+
+from src.perception.vlm.base import DetectionResult, VLMAdapter
+
+logger = logging.getLogger(__name__)
+
+SOCKET_PATH = "/tmp/winston-vlm.sock"
+
+_HEADER_MAX_BYTES = 64 * 1024
+
+
+# ------------------------------------------------------------------
+# Framing helpers
+# ------------------------------------------------------------------
+
+def _new_frame_fd() -> int:
+    """Anonymous shared-memory fd for frame handoff."""
+    if hasattr(os, "memfd_create"):
+        return os.memfd_create("winston-frame", os.MFD_CLOEXEC)
+    f = tempfile.TemporaryFile()   # already unlinked on POSIX
+    fd = os.dup(f.fileno())
+    f.close()
+    return fd
+
+
+def _recv_header(conn: socket.socket) -> tuple[dict | None, list[int]]:
+    """Read one JSON header line plus any fds sent alongside it. (None, []) on EOF."""
+    buf = b""
+    fds: list[int] = []
+    while b"\n" not in buf:
+        data, new_fds, _, _ = socket.recv_fds(conn, _HEADER_MAX_BYTES, 4)
+        fds.extend(new_fds)
+        if not data:
+            for fd in fds:
+                os.close(fd)
+            return None, []
+        buf += data
+        if len(buf) > _HEADER_MAX_BYTES:
+            raise ValueError("VLM request header too large")
+    return json.loads(buf), fds
+
+
+def _send_line(conn: socket.socket, payload: dict) -> None:
+    conn.sendall(json.dumps(payload).encode() + b"\n")
+
+
+# ------------------------------------------------------------------
+# Server
+# ------------------------------------------------------------------
+
+class VLMServer:
+    """Owns a loaded VLMAdapter and answers detect requests on a Unix socket."""
+
+    def __init__(self, adapter: VLMAdapter, socket_path: str = SOCKET_PATH) -> None:
+        self._adapter = adapter
+        self._socket_path = socket_path
+        self._sock: socket.socket | None = None
+
+    def serve_forever(self) -> None:
+        self._adapter.load()
+
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)   # stale socket from a crashed server
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self._socket_path)
+        self._sock.listen(1)
+        logger.info("VLM server listening on %s", self._socket_path)
+
+        # One model, one inference at a time — connections are served sequentially.
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                break   # closed by stop()
+            with conn:
+                logger.info("VLM client connected")
+                self._serve_connection(conn)
+                logger.info("VLM client disconnected")
+
+    def stop(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+        self._adapter.unload()
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        while True:
+            try:
+                header, fds = _recv_header(conn)
+            except (OSError, ValueError) as e:
+                logger.warning("VLM server: bad request — %s", e)
+                return
+            if header is None:
+                return
+
+            try:
+                if header.get("op") != "detect" or len(fds) != 1:
+                    raise ValueError(f"unsupported request: op={header.get('op')!r} fds={len(fds)}")
+                image = self._read_frame(fds[0], header["shape"])
+                labels = header.get("labels")
+                result = self._adapter.detect(
+                    image, header["prompt"], frozenset(labels) if labels else None
+                )
+                response = asdict(result)
+            except Exception as e:
+                logger.exception("VLM server: detect failed")
+                response = {"error": str(e)}
+            finally:
+                for fd in fds:
+                    os.close(fd)
+
+            try:
+                _send_line(conn, response)
+            except OSError:
+                return
+
+    @staticmethod
+    def _read_frame(fd: int, shape: list[int]) -> Image.Image:
+        h, w, _ = shape
+        with mmap.mmap(fd, h * w * 3, access=mmap.ACCESS_READ) as m:
+            return Image.frombytes("RGB", (w, h), m)
+
+
+# ------------------------------------------------------------------
+# Client
+# ------------------------------------------------------------------
+
+class VLMClient(VLMAdapter):
+    """
+    VLMAdapter that forwards detect() to a running VLMServer.
+
+    load() only connects — the weights stay resident in the server process.
+    """
+
+    def __init__(self, socket_path: str = SOCKET_PATH) -> None:
+        self._socket_path = socket_path
+        self._sock: socket.socket | None = None
+        self._reader = None
+        self._frame_fd: int | None = None
+        self._frame_size = 0
+
+    def load(self) -> None:
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(self._socket_path)
+        except OSError as e:
+            self._sock.close()
+            self._sock = None
+            raise RuntimeError(
+                f"VLM server not reachable at {self._socket_path} — "
+                "start it with: python -m src.perception.vlm_server"
+            ) from e
+        self._reader = self._sock.makefile("rb")
+        # One frame buffer for the client's lifetime; resized only if the frame size changes
+        self._frame_fd = _new_frame_fd()
+        logger.info("Connected to VLM server at %s", self._socket_path)
+
+    def unload(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self._frame_fd is not None:
+            os.close(self._frame_fd)
+            self._frame_fd = None
+            self._frame_size = 0
+
+    def detect(
+        self,
+        image: Image.Image,
+        prompt: str,
+        labels: frozenset[str] | None = None,
+    ) -> DetectionResult:
+        if self._sock is None:
+            raise RuntimeError("Call load() before detect()")
+
+        frame = np.asarray(image.convert("RGB"))
+        nbytes = frame.nbytes
+        if nbytes != self._frame_size:
+            os.ftruncate(self._frame_fd, nbytes)
+            self._frame_size = nbytes
+        with mmap.mmap(self._frame_fd, nbytes) as m:
+            m.write(np.ascontiguousarray(frame))
+
+        header = {
+            "op":     "detect",
+            "prompt": prompt,
+            "labels": sorted(labels) if labels else None,
+            "shape":  list(frame.shape),
+        }
+        socket.send_fds(self._sock, [json.dumps(header).encode() + b"\n"], [self._frame_fd])
+
+        line = self._reader.readline()
+        if not line:
+            raise RuntimeError("VLM server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise RuntimeError(f"VLM server error: {response['error']}")
+        return DetectionResult(**response)
+
+
+# ------------------------------------------------------------------
+# Entry point
+# ------------------------------------------------------------------
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(name)s: %(message)s",
+    )
+
+    from src.perception.scene_service import _load_adapter, load_config
+
+    scene_cfg = load_config()["scene"]
+    # Build the real adapter regardless of scene.vlm_server (that flag selects the client side)
+    adapter = _load_adapter({**scene_cfg, "vlm_server": False})
+    server = VLMServer(adapter, socket_path=scene_cfg.get("vlm_socket") or SOCKET_PATH)
+
+    def _shutdown(sig, frame):
+        logger.info("Shutting down VLM server...")
+        server.stop()
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT,  _shutdown)
+    signal.signal(signal.SIGTERM, _shutdown)
+
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
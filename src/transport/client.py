@@ -3,15 +3,29 @@ MQTT client wrapper around paho-mqtt.
 
 All publish calls auto-inject a UTC timestamp. Payloads are always JSON.
 Reconnect is handled automatically by paho's built-in loop.
+
+publish() never blocks on the network: with loop_start() paho only queues the
+packet and the background thread does the socket write (and any QoS 1 ACK
+handling). QoS 0 is the default for telemetry; callers pass qos=1 for the few
+messages that must arrive (scene changes, health). Nagle is disabled on the
+broker socket so small publishes go out immediately instead of waiting up to
+one delayed-ACK interval (~40ms) to coalesce.
 """
 
 import json
 import logging
+import socket
+import time
 from datetime import datetime, timezone
 from typing import Any, Callable
 
 import paho.mqtt.client as mqtt
 
+try:
+    import orjson
+except ImportError:   # stdlib json fallback in _dumps / _loads
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,8 +43,11 @@ class MQTTClient:
         self._client.on_disconnect = self._on_disconnect
         self._client.on_message = self._on_message_raw
 
-        # topic → list of handlers
+        # topic filter → list of handlers (exact topics and wildcard filters alike)
         self._handlers: dict[str, list[Callable[[dict], None]]] = {}
+        # Wildcard filters pre-split at subscribe time: (filter segments, handlers).
+        # The handler lists are shared with _handlers.
+        self._wildcards: list[tuple[tuple[str, ...], list[Callable[[dict], None]]]] = []
 
     # ------------------------------------------------------------------
     # Public API
@@ -51,12 +68,40 @@ class MQTTClient:
         """Publish a dict payload as JSON. Timestamp is injected automatically."""
         if "timestamp" not in payload:
             payload["timestamp"] = _utc_now()
-        self._client.publish(topic, json.dumps(payload), qos=qos)
+        self._client.publish(topic, _dumps(payload), qos=qos)
+
+    def publish_batch(
+        self,
+        messages: list[tuple[str, dict[str, Any]] | tuple[str, dict[str, Any], int]],
+        qos: int = 0,
+    ) -> None:
+        """
+        Publish several (topic, payload[, qos]) messages produced by one event.
+
+        Everything is timestamped (one shared timestamp) and serialized before the
+        first enqueue, so the packets land in paho's outgoing queue back-to-back
+        and the network thread flushes them in a single write pass. A message
+        without its own qos uses the qos argument.
+        """
+        ts = _utc_now()
+        encoded = []
+        for topic, payload, *msg_qos in messages:
+            if "timestamp" not in payload:
+                payload["timestamp"] = ts
+            encoded.append((topic, _dumps(payload), msg_qos[0] if msg_qos else qos))
+        for topic, data, q in encoded:
+            self._client.publish(topic, data, qos=q)
 
     def subscribe(self, topic: str, handler: Callable[[dict], None]) -> None:
-        """Subscribe to a topic and register a handler for decoded JSON payloads."""
+        """
+        Subscribe to a topic and register a handler for decoded JSON payloads.
+        The topic may be an MQTT filter with + (one level) or # (trailing, any depth).
+        """
         if topic not in self._handlers:
-            self._handlers[topic] = []
+            handlers: list[Callable[[dict], None]] = []
+            self._handlers[topic] = handlers
+            if "+" in topic or "#" in topic:
+                self._wildcards.append((tuple(topic.split("/")), handlers))
             self._client.subscribe(topic)
         self._handlers[topic].append(handler)
 
@@ -67,6 +112,11 @@ class MQTTClient:
     def _on_connect(self, client, userdata, flags, reason_code, properties) -> None:
         if reason_code == 0:
             logger.info("MQTT connected")
+            # Each (re)connect opens a fresh socket — set TCP_NODELAY on it
+            try:
+                client.socket().setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (AttributeError, OSError):   # websocket wrapper / unix socket
+                logger.debug("MQTT: TCP_NODELAY not applicable to this transport")
             # Re-subscribe after reconnect
             for topic in self._handlers:
                 client.subscribe(topic)
@@ -78,14 +128,24 @@ class MQTTClient:
             logger.warning("MQTT unexpected disconnect (reason_code=%s) — will reconnect", reason_code)
 
     def _on_message_raw(self, client, userdata, message) -> None:
-        topic = message.topic
+        topic = message.topic   # property — decodes on every access, so read it once
+
+        # Resolve handlers before decoding: a message nobody consumes is never parsed
+        handlers = self._handlers.get(topic, [])
+        if self._wildcards:
+            levels = topic.split("/")
+            matched = [hs for parts, hs in self._wildcards if _filter_matches(parts, levels)]
+            if matched:
+                handlers = [h for hs in (handlers, *matched) for h in hs]
+        if not handlers:
+            return
+
         try:
-            payload = json.loads(message.payload.decode())
-        except json.JSONDecodeError:
+            payload = _loads(message.payload)
+        except ValueError:   # JSONDecodeError / orjson.JSONDecodeError, UnicodeDecodeError
             logger.warning("Non-JSON message on %s — ignoring", topic)
             return
 
-        handlers = self._handlers.get(topic, [])
         for handler in handlers:
             try:
                 handler(payload)
@@ -93,5 +153,45 @@ class MQTTClient:
                 logger.exception("Handler error on topic %s", topic)
 
 
+def _filter_matches(filter_parts: tuple[str, ...], levels: list[str]) -> bool:
+    """MQTT topic-filter match on pre-split levels. Wildcards never match $-topics."""
+    if levels[0].startswith("$") and filter_parts[0] in ("+", "#"):
+        return False
+    for i, part in enumerate(filter_parts):
+        if part == "#":
+            return True   # also matches the parent level itself ("a/#" matches "a")
+        if i >= len(levels) or (part != "+" and part != levels[i]):
+            return False
+    return len(filter_parts) == len(levels)
+
+
+def _dumps(payload: dict[str, Any]) -> bytes | str:
+    """Serialize a payload: orjson (bytes, numpy-aware) when installed, else stdlib json."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload)
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a payload straight from bytes (orjson validates UTF-8 itself)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") — publishes within the same second reuse
+# the formatted prefix. Rebinding a tuple is atomic, so no lock across publishers.
+_iso_second: tuple[int, str] = (-1, "")
+
+
 def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    """Same string as datetime.now(timezone.utc).isoformat(), without a datetime per call."""
+    global _iso_second
+    sec, us = divmod(time.time_ns() // 1000, 1_000_000)
+    cached = _iso_second
+    if cached[0] != sec:
+        cached = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+        _iso_second = cached
+    if us:
+        return f"{cached[1]}.{us:06d}+00:00"
+    return f"{cached[1]}+00:00"   # isoformat() omits a zero microsecond field
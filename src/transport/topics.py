@@ -1,6 +1,11 @@
 """
 MQTT topic constants — mirrors docs/architecture/mqtt_topics.md exactly.
 Import these everywhere; never hardcode topic strings.
+
+Topics are str on purpose: paho's publish() always does topic.encode("utf-8")
+(bytes topics raise), and incoming message.topic is decoded to str, which is
+what MQTTClient's handler table is keyed by. Pre-encoded bytes variants would
+not save any work.
 """
 
 PREFIX = "souschef"
@@ -11,9 +16,12 @@ class Perception:
     SENTIMENT     = f"{PREFIX}/perception/speech/sentiment"
     VAD           = f"{PREFIX}/perception/speech/vad"
     DIARIZATION   = f"{PREFIX}/perception/speech/diarization"
+    # Scene payloads never embed image bytes: frames are written to disk as JPEG
+    # and referenced by image_path (context / update.context / event).
     SCENE_SNAPSHOT      = f"{PREFIX}/perception/scene/snapshot"
     SCENE_CHANGE        = f"{PREFIX}/perception/scene/change"
     SCENE_CONTEXT       = f"{PREFIX}/perception/scene/context"        # text summary + image_path for cerebrum
+    SCENE_UPDATE        = f"{PREFIX}/perception/scene/update"         # snapshot + context + change, one message per snapshot
     SCENE_DETECT_REQUEST = f"{PREFIX}/perception/scene/detect"        # cerebrum → edge VLM (Phase B+)
     SCENE_EVENT         = f"{PREFIX}/perception/scene/event"          # edge VLM → cerebrum (confirmed event + image_path)
 